@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Проверка согласованности фактов ("14 таблиц", "6 типов вопросов", "95-97%" ...)
+# между create_presentation.py, markdown-записками, .docx и .pptx.
+#
+# Текст из OOXML читается потоково: из архива открываются только нужные члены
+# (word/document.xml, ppt/slides/slideN.xml) и разбираются через iterparse.
+# Извлеченные утверждения кэшируются по (mtime, size) файла, поэтому повторный
+# запуск переиндексирует только изменившиеся документы - годится для pre-commit.
+#
+# Использование:
+#   python3 check_consistency.py                  # пути по умолчанию
+#   python3 check_consistency.py docs README.md   # свои файлы/каталоги
+#   python3 check_consistency.py --all            # + все пары "число термин"
+#
+# Переданные пути всегда сверяются со всем набором по умолчанию, а в отчет
+# попадают только расхождения, затрагивающие эти пути - так pre-commit,
+# передающий лишь измененные файлы, ловит расхождение с остальными документами.
+#
+# Код возврата 1, если найдены расхождения.
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+# Пути по умолчанию и кэш отсчитываются от корня репозитория, а не от
+# текущего каталога, иначе запуск из другого места молча проверял бы 0 файлов
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+CACHE_FILE = os.path.join(REPO_ROOT, '.consistency_index.json')
+CACHE_VERSION = 1
+
+DEFAULT_PATHS = [
+    'create_presentation.py',
+    '9_сем_НИР_Jobzi',
+    'docs',
+    'README.md',
+    'BROADCAST_GUIDE.md',
+]
+
+TEXT_EXTENSIONS = ('.md', '.py', '.txt')
+OOXML_EXTENSIONS = ('.docx', '.pptx')
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+
+SLIDE_MEMBER = re.compile(r'^ppt/slides/slide(\d+)\.xml$')
+
+NUM = r'\d+(?:[.,]\d+)?(?:\s*[-–—]\s*\d+(?:[.,]\d+)?)?'
+
+# Отслеживаемые утверждения: название -> шаблон с одной группой-значением.
+# Разные значения одного утверждения в разных местах считаются расхождением.
+TRACKED_CLAIMS = {
+    'таблиц в БД': r'({num})\s+таблиц',
+    'типов вопросов': r'({num})\s+тип\w*\s+вопрос',
+    'статусов откликов': r'({num})\s+статус\w*(?:\s+отклик|\s*:\s*NEW)',
+    'шагов создания вакансии': r'создани\w*\s+ваканси\w*\s+за\s+({num})\s+шаг',
+    'экономия времени, %': r'экономи\w*[^\d%\n]{{0,30}}?({num})\s*%',
+    'сокращение времени, раз': r'сокращени\w*[^\d\n]{{0,40}}?\bв\s+({num})\s+раз\b',
+}
+
+# Пара "число + до двух следующих слов" для общего индекса терминов (--all)
+GENERIC_CLAIM = re.compile(r'(?<![\w.,])(' + NUM + r')\s+([А-Яа-яЁёA-Za-z]{3,})(?:\s+([А-Яа-яЁёA-Za-z]{2,}))?')
+
+RU_ENDINGS = re.compile(r'(?:ами|ями|ого|его|ому|ему|ыми|ими|ов|ев|ей|ам|ям|ах|ях|ой|ий|ый|ая|ое|ые|ую|а|я|ы|и|у|ю|о|е|ь)$')
+
+
+def compile_claims():
+    return {name: re.compile(pattern.format(num=NUM), re.IGNORECASE)
+            for name, pattern in TRACKED_CLAIMS.items()}
+
+
+def claims_signature():
+    # При изменении шаблонов кэш должен быть пересобран целиком
+    payload = json.dumps([CACHE_VERSION, TRACKED_CLAIMS, GENERIC_CLAIM.pattern], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def normalize_value(value):
+    value = re.sub(r'\s+', '', value)
+    value = re.sub(r'[–—]', '-', value)
+    return value.replace(',', '.')
+
+
+def stem(word):
+    word = word.lower()
+    stemmed = RU_ENDINGS.sub('', word)
+    return stemmed if len(stemmed) >= 3 else word
+
+
+# ---------- Потоковое извлечение текста ----------
+
+def iter_xml_paragraphs(stream, paragraph_tag, text_tag):
+    parts = []
+    for _, elem in iterparse(stream, events=('end',)):
+        if elem.tag == text_tag:
+            if elem.text:
+                parts.append(elem.text)
+        elif elem.tag == paragraph_tag:
+            if parts:
+                yield ''.join(parts)
+                parts = []
+            elem.clear()
+    if parts:
+        yield ''.join(parts)
+
+
+def iter_docx_text(path):
+    with zipfile.ZipFile(path) as archive:
+        with archive.open('word/document.xml') as stream:
+            for number, text in enumerate(iter_xml_paragraphs(stream, W_NS + 'p', W_NS + 't'), 1):
+                yield 'абзац %d' % number, text
+
+
+def iter_pptx_text(path):
+    with zipfile.ZipFile(path) as archive:
+        slides = []
+        for name in archive.namelist():
+            match = SLIDE_MEMBER.match(name)
+            if match:
+                slides.append((int(match.group(1)), name))
+
+        for number, name in sorted(slides):
+            with archive.open(name) as stream:
+                for text in iter_xml_paragraphs(stream, A_NS + 'p', A_NS + 't'):
+                    yield 'слайд %d' % number, text
+
+
+def iter_plain_text(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for number, line in enumerate(f, 1):
+            yield 'строка %d' % number, line
+
+
+def iter_document_text(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.docx':
+        return iter_docx_text(path)
+    if extension == '.pptx':
+        return iter_pptx_text(path)
+    return iter_plain_text(path)
+
+
+# ---------- Индексация ----------
+
+def extract_claims(path, patterns):
+    claims = []
+    for location, text in iter_document_text(path):
+        for name, pattern in patterns.items():
+            for match in pattern.finditer(text):
+                claims.append(['claim', name, normalize_value(match.group(1)), location])
+
+        for match in GENERIC_CLAIM.finditer(text):
+            words = [stem(w) for w in match.group(2, 3) if w]
+            claims.append(['term', ' '.join(words), normalize_value(match.group(1)), location])
+    return claims
+
+
+def index_key(path):
+    # Ключ файла в индексе: путь от корня репозитория, для внешних файлов - абсолютный
+    path = os.path.abspath(path)
+    relative = os.path.relpath(path, REPO_ROOT)
+    return path if relative.startswith(os.pardir) else relative
+
+
+def is_document(name):
+    return not name.startswith('~$') and name.lower().endswith(TEXT_EXTENSIONS + OOXML_EXTENSIONS)
+
+
+def collect_files(paths, base=None):
+    # Пути из командной строки - от текущего каталога, пути по умолчанию - от корня
+    # репозитория. Файлы с другими расширениями (.kt, .jar, .png из pre-commit)
+    # пропускаются так же, как при обходе каталогов
+    files = []
+    for path in paths:
+        if base is not None:
+            path = os.path.join(base, path)
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+                for name in sorted(names):
+                    if is_document(name):
+                        files.append(index_key(os.path.join(root, name)))
+        elif os.path.isfile(path):
+            if is_document(os.path.basename(path)):
+                files.append(index_key(path))
+        else:
+            print("Пропущен несуществующий путь: %s" % path, file=sys.stderr)
+    return files
+
+
+def load_cache(cache_path, signature):
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('signature') != signature:
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(cache_path, signature, files):
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'signature': signature, 'files': files}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+
+def update_index(files, cached):
+    # Кэш дополняется, а не заменяется: записи других файлов нужны следующим
+    # запускам, удаляются только записи исчезнувших файлов
+    patterns = compile_claims()
+    entries = {path: entry for path, entry in cached.items() if os.path.exists(os.path.join(REPO_ROOT, path))}
+    reindexed = 0
+
+    for path in files:
+        stat = os.stat(os.path.join(REPO_ROOT, path))
+        entry = entries.get(path)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            continue
+
+        try:
+            claims = extract_claims(os.path.join(REPO_ROOT, path), patterns)
+        except (zipfile.BadZipFile, KeyError, SyntaxError) as e:
+            print("Не удалось прочитать %s: %s" % (path, e), file=sys.stderr)
+            claims = []
+
+        entries[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'claims': claims}
+        reindexed += 1
+
+    return entries, reindexed
+
+
+def build_inverted_index(entries, files, include_terms):
+    # (вид, ключ) -> значение -> [(файл, место)]
+    index = {}
+    for path in sorted(files):
+        for kind, key, value, location in entries[path]['claims']:
+            if kind == 'term' and not include_terms:
+                continue
+            values = index.setdefault((kind, key), {})
+            values.setdefault(value, []).append((path, location))
+    return index
+
+
+def find_conflicts(index, focus=None):
+    conflicts = []
+    for (kind, key), values in sorted(index.items()):
+        if len(values) < 2:
+            continue
+        files = {path for locations in values.values() for path, _ in locations}
+        # Термин без расхождения между файлами - обычно разные сущности в одном тексте
+        if kind == 'term' and len(files) < 2:
+            continue
+        if focus is not None and not files & focus:
+            continue
+        conflicts.append((kind, key, values))
+    return conflicts
+
+
+def print_conflicts(conflicts, max_locations=5):
+    for kind, key, values in conflicts:
+        label = key if kind == 'claim' else '"%s" (термин)' % key
+        print("\n%s:" % label)
+        for value, locations in sorted(values.items(), key=lambda item: -len(item[1])):
+            shown = ', '.join('%s (%s)' % location for location in locations[:max_locations])
+            if len(locations) > max_locations:
+                shown += ' и еще %d' % (len(locations) - max_locations)
+            print("  %s  [%d]  %s" % (value, len(locations), shown))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Проверка согласованности фактов в документах Jobzi")
+    parser.add_argument('paths', nargs='*', help="файлы или каталоги (по умолчанию - материалы НИР)")
+    parser.add_argument('--all', action='store_true', help="сообщать о расхождениях любых пар 'число термин'")
+    parser.add_argument('--rebuild', action='store_true', help="игнорировать кэш и переиндексировать все файлы")
+    parser.add_argument('--cache', default=CACHE_FILE, help="путь к файлу кэша индекса")
+    args = parser.parse_args(argv)
+
+    defaults = collect_files(DEFAULT_PATHS, base=REPO_ROOT)
+    if not defaults:
+        print("Не найдено ни одного документа по умолчанию в %s" % REPO_ROOT, file=sys.stderr)
+        return 2
+
+    focus = set(collect_files(args.paths)) if args.paths else None
+    files = list(dict.fromkeys(defaults + sorted(focus or ())))
+    signature = claims_signature()
+    cached = {} if args.rebuild else load_cache(args.cache, signature)
+
+    entries, reindexed = update_index(files, cached)
+    save_cache(args.cache, signature, entries)
+
+    index = build_inverted_index(entries, files, args.all)
+    conflicts = find_conflicts(index, focus)
+
+    print("Проиндексировано файлов: %d (обновлено: %d)" % (len(files), reindexed))
+    if not conflicts:
+        print("Расхождений не найдено")
+        return 0
+
+    print("Найдено расхождений: %d" % len(conflicts))
+    print_conflicts(conflicts)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
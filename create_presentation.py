@@ -6,30 +6,56 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
-def create_presentation():
+def new_presentation():
     prs = Presentation()
     prs.slide_width = Inches(10)
     prs.slide_height = Inches(7.5)
+    return prs
 
-    # Слайд 1: Титульный
+def add_title_slide(prs, title_text, subtitle_text):
     slide = prs.slides.add_slide(prs.slide_layouts[6])
 
     title_box = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(8), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = "Разработка системы автоматизации подбора временного персонала на базе Telegram Bot API"
+    title_frame.text = title_text
     title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     title_frame.paragraphs[0].font.size = Pt(28)
     title_frame.paragraphs[0].font.bold = True
 
     subtitle_box = slide.shapes.add_textbox(Inches(1), Inches(4), Inches(8), Inches(2))
     subtitle_frame = subtitle_box.text_frame
-    subtitle_text = """Выполнил: Куртяков А.
-Научно-исследовательская работа
-9 семестр, 2025-2026 уч. год"""
     subtitle_frame.text = subtitle_text
     subtitle_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     for paragraph in subtitle_frame.paragraphs:
         paragraph.font.size = Pt(18)
+    return slide
+
+def add_bullet_slide(prs, title_text):
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = title_text
+
+    tf = slide.placeholders[1].text_frame
+    tf.clear()
+    return tf
+
+def add_paragraph(tf, text, level=0, size=18, bold=False, color=None):
+    p = tf.paragraphs[0] if not tf.paragraphs[0].text else tf.add_paragraph()
+    p.text = text
+    p.level = level
+    p.font.size = Pt(size)
+    p.font.bold = bold
+    if color is not None:
+        p.font.color.rgb = RGBColor(*color)
+    return p
+
+def create_presentation():
+    prs = new_presentation()
+
+    # Слайд 1: Титульный
+    subtitle_text = """Выполнил: Куртяков А.
+Научно-исследовательская работа
+9 семестр, 2025-2026 уч. год"""
+    add_title_slide(prs, "Разработка системы автоматизации подбора временного персонала на базе Telegram Bot API", subtitle_text)
 
     # Слайд 2: Актуальность
     slide = prs.slides.add_slide(prs.slide_layouts[1])
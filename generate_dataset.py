@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Генератор синтетических данных Jobzi для нагрузочного тестирования.
+#
+# Строки строятся по реальной схеме (см. src/main/resources/db/changelog):
+# businesses, users, business_users, vacancies (коды ABC123), questions (6 типов),
+# applications, answers (со snapshot контекста вопроса) и broadcast_campaigns.
+# Распределение вакансий по бизнесам и откликов по вакансиям - Zipf со
+# степенью --skew (0 - равномерно, 1+ - несколько "горячих" вакансий).
+#
+# Данные загружаются через COPY пачками, вакансии/отклики - параллельно
+# несколькими процессами, каждый в своей транзакции. Генерация детерминирована
+# (--seed), поэтому воркеры не обмениваются данными, а только диапазонами id.
+#
+# Использование:
+#   python3 generate_dataset.py --answers 10000000 --truncate
+#   python3 generate_dataset.py --dsn "host=localhost dbname=jobzi user=jobzi password=jobzi"
+#   python3 generate_dataset.py --out /tmp/jobzi_data     # только файлы COPY, без БД
+#
+# Для загрузки в БД нужен psycopg2 (pip install psycopg2-binary), схема должна
+# быть создана миграциями Liquibase (запуском приложения).
+
+import argparse
+import io
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+DEFAULT_DSN = 'host=localhost port=5432 dbname=jobzi user=jobzi password=jobzi'
+
+# Синтетические telegram id не пересекаются с реальными
+TELEGRAM_ID_BASE = 9000000000
+
+CODE_LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+CODE_SPACE = 26 ** 3 * 1000
+CODE_STEP = 7368787  # взаимно просто с CODE_SPACE - перестановка без коллизий
+
+QUESTION_TYPES = ['TEXT', 'PHONE', 'NUMBER', 'DATE', 'YES_NO', 'CHOICE']
+QUESTION_TYPE_WEIGHTS = [30, 20, 15, 10, 15, 10]
+
+VACANCY_STATUSES = ['ACTIVE', 'PAUSED', 'CLOSED', 'DRAFT']
+VACANCY_STATUS_WEIGHTS = [60, 10, 20, 10]
+
+APPLICATION_STATUSES = ['NEW', 'VIEWED', 'CONTACTED', 'ACCEPTED', 'REJECTED']
+APPLICATION_STATUS_WEIGHTS = [35, 25, 15, 10, 15]
+
+CAMPAIGN_STATUSES = ['DRAFT', 'READY', 'SENT']
+SCHEDULE_TYPES = ['ONCE', 'DAILY', 'WEEKLY', 'CUSTOM']
+
+VACANCY_TITLES = [
+    'Грузчик', 'Разнорабочий', 'Курьер', 'Промоутер', 'Официант', 'Бариста',
+    'Кассир', 'Упаковщик', 'Комплектовщик', 'Уборщик', 'Монтажник', 'Подсобный рабочий',
+]
+LOCATIONS = ['Москва', 'Санкт-Петербург', 'Казань', 'Екатеринбург', 'Новосибирск', 'Нижний Новгород']
+SALARIES = ['2000 ₽/смена', '2500 ₽/смена', '3000 ₽/смена', '350 ₽/час', '500 ₽/час', 'по договоренности']
+FIRST_NAMES = ['Иван', 'Алексей', 'Мария', 'Ольга', 'Дмитрий', 'Анна', 'Сергей', 'Екатерина', 'Артем', 'Наталья']
+LAST_NAMES = ['Иванов', 'Смирнов', 'Кузнецов', 'Попов', 'Васильев', 'Петров', 'Соколов', 'Михайлов']
+
+QUESTION_TEXTS = {
+    'TEXT': ['Расскажите о своем опыте работы', 'Как вас зовут?', 'Почему вас заинтересовала вакансия?'],
+    'PHONE': ['Ваш номер телефона', 'Контактный телефон для связи'],
+    'NUMBER': ['Сколько вам лет?', 'Сколько лет опыта работы?', 'Сколько смен в неделю готовы работать?'],
+    'DATE': ['С какой даты готовы выйти?', 'Дата рождения'],
+    'YES_NO': ['Есть ли медицинская книжка?', 'Готовы к ночным сменам?', 'Есть ли гражданство РФ?'],
+    'CHOICE': ['Удобное время работы', 'Предпочтительный район'],
+}
+CHOICE_OPTIONS = {
+    'Удобное время работы': ['Утро', 'День', 'Вечер', 'Ночь'],
+    'Предпочтительный район': ['Центр', 'Север', 'Юг', 'Запад', 'Восток'],
+}
+TEXT_ANSWERS = [
+    'Работал грузчиком на складе 2 года', 'Опыта нет, готов учиться', 'Нужна подработка на выходные',
+    'Есть опыт работы в общепите', 'Ищу постоянную подработку рядом с домом',
+]
+
+TABLE_COLUMNS = {
+    'businesses': ['id', 'name', 'telegram_chat_id', 'description', 'is_active', 'created_at', 'updated_at'],
+    'users': ['id', 'telegram_id', 'first_name', 'last_name', 'username', 'phone_number', 'is_active',
+              'role', 'created_at', 'updated_at'],
+    'business_users': ['id', 'business_id', 'user_id', 'role', 'created_at'],
+    'vacancies': ['id', 'business_id', 'code', 'title', 'description', 'location', 'salary', 'status',
+                  'created_at', 'updated_at', 'published_at'],
+    'questions': ['id', 'vacancy_id', 'question_text', 'question_type', 'is_required', 'order_index',
+                  'options', 'created_at'],
+    'applications': ['id', 'vacancy_id', 'user_id', 'status', 'notes', 'created_at', 'updated_at'],
+    'answers': ['id', 'application_id', 'question_id', 'answer_text', 'created_at', 'question_text',
+                'question_type', 'question_order'],
+    'broadcast_campaigns': ['id', 'business_id', 'title', 'message_text', 'status', 'created_by_user_id',
+                            'created_at', 'updated_at', 'schedule_enabled', 'schedule_type',
+                            'schedule_interval_hours', 'scheduled_at', 'last_sent_at', 'next_send_at'],
+}
+
+# Порядок загрузки важен из-за внешних ключей
+LOAD_ORDER = ['businesses', 'users', 'business_users', 'vacancies', 'questions',
+              'applications', 'answers', 'broadcast_campaigns']
+
+
+# ---------- Форматирование COPY (text format) ----------
+
+COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def copy_value(value):
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, str):
+        return value.translate(COPY_ESCAPES)
+    return str(value)
+
+
+def copy_row(values):
+    return '\t'.join([copy_value(v) for v in values]) + '\n'
+
+
+def format_ts(ts):
+    return time.strftime('%Y-%m-%d %H:%M:%S+00', time.gmtime(ts))
+
+
+# ---------- Детерминированные генераторы ----------
+
+def vacancy_code(vacancy_id):
+    n = (vacancy_id * CODE_STEP) % CODE_SPACE
+    digits = n % 1000
+    n //= 1000
+    letters = ''
+    for _ in range(3):
+        letters = CODE_LETTERS[n % 26] + letters
+        n //= 26
+    return '%s%03d' % (letters, digits)
+
+
+def vacancy_questions(seed, vacancy_id, count):
+    # Вопросы вакансии - чистая функция от (seed, vacancy_id), чтобы воркер
+    # откликов мог восстановить snapshot контекста, не читая БД
+    rng = random.Random(seed * 1000003 + vacancy_id)
+    # Тексты выбираются без повторов; исчерпанный тип больше не выпадает
+    pools = {question_type: list(texts) for question_type, texts in QUESTION_TEXTS.items()}
+    questions = []
+    for order in range(1, count + 1):
+        types = [t for t in QUESTION_TYPES if pools[t]]
+        weights = [QUESTION_TYPE_WEIGHTS[QUESTION_TYPES.index(t)] for t in types]
+        question_type = rng.choices(types, weights)[0]
+        pool = pools[question_type]
+        text = pool.pop(rng.randrange(len(pool)))
+        options = CHOICE_OPTIONS[text] if question_type == 'CHOICE' else None
+        questions.append((text, question_type, options, order))
+    return questions
+
+
+def answer_text(rng, question_type, options):
+    if question_type == 'TEXT':
+        return rng.choice(TEXT_ANSWERS)
+    if question_type == 'PHONE':
+        return '+79%09d' % rng.randrange(10 ** 9)
+    if question_type == 'NUMBER':
+        return str(rng.randint(18, 60))
+    if question_type == 'DATE':
+        return '%02d.%02d.%d' % (rng.randint(1, 28), rng.randint(1, 12), rng.randint(1970, 2006))
+    if question_type == 'YES_NO':
+        return 'Да' if rng.random() < 0.7 else 'Нет'
+    return rng.choice(options)
+
+
+def zipf_split(rng, total, buckets, skew, minimum=0, cap=None):
+    weights = [1.0 / (rank ** skew) for rank in range(1, buckets + 1)]
+    rng.shuffle(weights)
+    scale = max(total - minimum * buckets, 0) / sum(weights)
+    counts = [minimum + int(round(w * scale)) for w in weights]
+    if cap is not None:
+        counts = [min(c, cap) for c in counts]
+    return counts
+
+
+# ---------- План: количество строк и диапазоны id ----------
+
+def build_plan(opts):
+    rng = random.Random(opts.seed)
+    avg_questions = (opts.min_questions + opts.max_questions) / 2.0
+    applications = opts.applications or int(opts.answers / avg_questions)
+    total_vacancies = opts.businesses * opts.vacancies_per_business
+
+    per_business = zipf_split(rng, total_vacancies, opts.businesses, opts.skew, minimum=1)
+    vacancies = []
+    for business_index, count in enumerate(per_business):
+        for _ in range(count):
+            vacancies.append([business_index + 1, rng.randint(opts.min_questions, opts.max_questions),
+                              rng.choices(VACANCY_STATUSES, VACANCY_STATUS_WEIGHTS)[0]])
+
+    # Черновики не опубликованы, откликов на них нет - их доля уходит остальным
+    published = [vacancy for vacancy in vacancies if vacancy[2] != 'DRAFT']
+    per_vacancy = zipf_split(rng, applications, len(published), opts.skew, cap=opts.users) if published else []
+    for vacancy in vacancies:
+        vacancy.append(0)
+    for vacancy, count in zip(published, per_vacancy):
+        vacancy[3] = count
+
+    # Делим на чанки примерно равного объема ответов
+    chunks = []
+    target = max(opts.chunk_answers, 1)
+    ids = {'vacancy': 1, 'question': 1, 'application': 1, 'answer': 1}
+    chunk = None
+    for index, (_, questions, _, apps) in enumerate(vacancies):
+        if chunk is None:
+            chunk = dict(ids, first=index, last=index, answers=0)
+        chunk['last'] = index + 1
+        chunk['answers'] += questions * apps
+        ids['vacancy'] += 1
+        ids['question'] += questions
+        ids['application'] += apps
+        ids['answer'] += questions * apps
+        if chunk['answers'] >= target:
+            chunks.append(chunk)
+            chunk = None
+    if chunk is not None:
+        chunks.append(chunk)
+
+    totals = {
+        'businesses': opts.businesses,
+        'users': opts.users + opts.businesses,
+        'business_users': opts.businesses,
+        'vacancies': len(vacancies),
+        'questions': ids['question'] - 1,
+        'applications': ids['application'] - 1,
+        'answers': ids['answer'] - 1,
+        'broadcast_campaigns': opts.businesses * opts.campaigns_per_business,
+    }
+    return vacancies, chunks, totals
+
+
+# ---------- Генерация строк ----------
+
+def generate_businesses(opts):
+    rng = random.Random(opts.seed + 1)
+    for business_id in range(1, opts.businesses + 1):
+        created = opts.until - rng.uniform(opts.days, opts.days * 2) * 86400
+        yield (business_id, 'ООО "Бизнес %d"' % business_id, TELEGRAM_ID_BASE + business_id,
+               'Синтетический работодатель #%d' % business_id, True, format_ts(created), format_ts(created))
+
+
+def admin_user_id(opts, business_id):
+    # Админы бизнесов идут после соискателей
+    return opts.users + business_id
+
+
+def generate_users(opts):
+    rng = random.Random(opts.seed + 2)
+    for user_id in range(1, opts.users + opts.businesses + 1):
+        created = format_ts(opts.until - rng.uniform(0, opts.days * 2) * 86400)
+        yield (user_id, TELEGRAM_ID_BASE + user_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+               'user%d' % user_id, '+79%09d' % rng.randrange(10 ** 9), True, 'USER', created, created)
+
+
+def generate_business_users(opts):
+    created = format_ts(opts.until - opts.days * 2 * 86400)
+    for business_id in range(1, opts.businesses + 1):
+        yield business_id, business_id, admin_user_id(opts, business_id), 'ADMIN', created
+
+
+def generate_campaigns(opts):
+    rng = random.Random(opts.seed + 3)
+    campaign_id = 0
+    for business_id in range(1, opts.businesses + 1):
+        for number in range(1, opts.campaigns_per_business + 1):
+            campaign_id += 1
+            created = opts.until - rng.uniform(0, opts.days) * 86400
+            status = rng.choice(CAMPAIGN_STATUSES)
+            schedule_type = rng.choice(SCHEDULE_TYPES)
+            enabled = schedule_type != 'ONCE' and status != 'DRAFT'
+            last_sent = format_ts(created + 3600) if status == 'SENT' else None
+            next_send = format_ts(opts.until + rng.uniform(1, 48) * 3600) if enabled else None
+            yield (campaign_id, business_id, 'Кампания %d' % number,
+                   'Ищем сотрудников! Отправьте код вакансии боту.', status, admin_user_id(opts, business_id),
+                   format_ts(created), format_ts(created), enabled, schedule_type,
+                   rng.choice([6, 12, 24]) if schedule_type == 'CUSTOM' else None,
+                   format_ts(created + 86400) if schedule_type == 'ONCE' else None, last_sent, next_send)
+
+
+def vacancy_created_at(opts, vacancy_id):
+    rng = random.Random(opts.seed * 7 + vacancy_id)
+    return opts.until - rng.uniform(0, opts.days) * 86400
+
+
+def generate_vacancy_rows(opts, vacancies, chunk):
+    rng = random.Random(opts.seed * 31 + chunk['vacancy'])
+    question_id = chunk['question']
+    for offset, (business_id, question_count, status, _) in enumerate(vacancies[chunk['first']:chunk['last']]):
+        vacancy_id = chunk['vacancy'] + offset
+        created_ts = vacancy_created_at(opts, vacancy_id)
+        created = format_ts(created_ts)
+        title = rng.choice(VACANCY_TITLES)
+        yield 'vacancies', (vacancy_id, business_id, vacancy_code(vacancy_id), title,
+                            '%s на временную работу, оплата ежедневно' % title, rng.choice(LOCATIONS),
+                            rng.choice(SALARIES), status, created, created,
+                            None if status == 'DRAFT' else created)
+
+        for text, question_type, options, order in vacancy_questions(opts.seed, vacancy_id, question_count):
+            yield 'questions', (question_id, vacancy_id, text, question_type, True, order,
+                                json.dumps(options, ensure_ascii=False) if options else None, created)
+            question_id += 1
+
+
+def generate_application_rows(opts, vacancies, chunk):
+    rng = random.Random(opts.seed * 37 + chunk['vacancy'])
+    application_id = chunk['application']
+    answer_id = chunk['answer']
+    question_id = chunk['question']
+    for offset, (_, question_count, _, apps) in enumerate(vacancies[chunk['first']:chunk['last']]):
+        vacancy_id = chunk['vacancy'] + offset
+        questions = vacancy_questions(opts.seed, vacancy_id, question_count)
+        start_ts = vacancy_created_at(opts, vacancy_id)
+        # Шаг взаимно прост с числом соискателей - отклики вакансии от разных пользователей
+        stride = 1 + (vacancy_id * 2654435761) % (opts.users - 1) if opts.users > 1 else 1
+        while opts.users > 1 and math.gcd(stride, opts.users) != 1:
+            stride += 1
+        first_user = (vacancy_id * 40503) % opts.users
+
+        for n in range(apps):
+            user_id = (first_user + n * stride) % opts.users + 1
+            created = format_ts(rng.uniform(start_ts, opts.until))
+            status = rng.choices(APPLICATION_STATUSES, APPLICATION_STATUS_WEIGHTS)[0]
+            yield 'applications', (application_id, vacancy_id, user_id, status, None, created, created)
+
+            for index, (text, question_type, options, order) in enumerate(questions):
+                yield 'answers', (answer_id, application_id, question_id + index,
+                                  answer_text(rng, question_type, options), created, text, question_type, order)
+                answer_id += 1
+            application_id += 1
+        question_id += question_count
+
+
+# ---------- Загрузка ----------
+
+class CopySink:
+    """Накапливает строки по таблицам и сбрасывает их пачками через COPY или в файлы."""
+
+    def __init__(self, opts, suffix=''):
+        self.opts = opts
+        self.suffix = suffix
+        self.buffers = {}
+        self.counts = {}
+        self.files = {}
+        self.connection = None
+        if not opts.out:
+            self.connection = connect(opts.dsn)
+
+    def write(self, table, values):
+        buffer = self.buffers.get(table)
+        if buffer is None:
+            buffer = self.buffers[table] = []
+        buffer.append(copy_row(values))
+        if len(buffer) >= self.opts.batch_rows:
+            self.flush_all()
+
+    def flush_all(self):
+        # Родительские таблицы сбрасываются раньше дочерних (внешние ключи)
+        for table in LOAD_ORDER:
+            self.flush(table)
+
+    def flush(self, table):
+        rows = self.buffers.get(table)
+        if not rows:
+            return
+        data = ''.join(rows)
+        self.counts[table] = self.counts.get(table, 0) + len(rows)
+        self.buffers[table] = []
+
+        if self.connection is None:
+            f = self.files.get(table)
+            if f is None:
+                path = os.path.join(self.opts.out, '%s%s.tsv' % (table, self.suffix))
+                f = self.files[table] = open(path, 'w', encoding='utf-8')
+            f.write(data)
+            return
+
+        with self.connection.cursor() as cursor:
+            cursor.copy_expert('COPY %s (%s) FROM STDIN' % (table, ', '.join(TABLE_COLUMNS[table])),
+                               io.StringIO(data))
+
+    def close(self):
+        self.flush_all()
+        for f in self.files.values():
+            f.close()
+        if self.connection is not None:
+            self.connection.commit()
+            self.connection.close()
+        return self.counts
+
+
+def connect(dsn):
+    try:
+        import psycopg2
+    except ImportError:
+        sys.exit("Для загрузки в БД нужен psycopg2: pip install psycopg2-binary (или используйте --out)")
+    return psycopg2.connect(dsn)
+
+
+def load_serial(opts, generators):
+    sink = CopySink(opts)
+    for table, rows in generators:
+        for values in rows:
+            sink.write(table, values)
+        sink.flush(table)
+    return sink.close()
+
+
+def load_chunk(task):
+    opts, vacancies, chunk, phase = task
+    sink = CopySink(opts, suffix='.%s.%06d' % (phase, chunk['vacancy']))
+    rows = generate_vacancy_rows if phase == 'vacancies' else generate_application_rows
+    for table, values in rows(opts, vacancies, chunk):
+        sink.write(table, values)
+    return sink.close()
+
+
+def load_parallel(opts, vacancies, chunks, phase, pool):
+    totals = {}
+    # Воркеру передается только срез плана своего чанка с first/last относительно среза
+    tasks = [(opts, vacancies[chunk['first']:chunk['last']], dict(chunk, first=0, last=chunk['last'] - chunk['first']),
+              phase) for chunk in chunks]
+    for counts in pool.imap_unordered(load_chunk, tasks):
+        for table, count in counts.items():
+            totals[table] = totals.get(table, 0) + count
+    return totals
+
+
+def prepare_database(opts):
+    connection = connect(opts.dsn)
+    with connection.cursor() as cursor:
+        if opts.truncate:
+            cursor.execute('TRUNCATE %s RESTART IDENTITY CASCADE' % ', '.join(reversed(LOAD_ORDER)))
+        else:
+            cursor.execute('SELECT EXISTS (SELECT 1 FROM businesses) OR EXISTS (SELECT 1 FROM users)')
+            if cursor.fetchone()[0]:
+                sys.exit("База не пуста: используйте --truncate для очистки таблиц перед загрузкой")
+    connection.commit()
+    connection.close()
+
+
+def finish_database(opts):
+    connection = connect(opts.dsn)
+    with connection.cursor() as cursor:
+        for table in LOAD_ORDER:
+            cursor.execute("SELECT setval(pg_get_serial_sequence('%s', 'id'), COALESCE(MAX(id), 0) + 1, false) "
+                           "FROM %s" % (table, table))
+        cursor.execute('ANALYZE')
+    connection.commit()
+    connection.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Генерация синтетических данных Jobzi с загрузкой через COPY")
+    parser.add_argument('--dsn', default=os.environ.get('JOBZI_DSN', DEFAULT_DSN), help="строка подключения libpq")
+    parser.add_argument('--out', help="вместо загрузки в БД записать файлы COPY в каталог")
+    parser.add_argument('--businesses', type=int, default=1000)
+    parser.add_argument('--vacancies-per-business', type=int, default=20)
+    parser.add_argument('--users', type=int, default=200000, help="число соискателей")
+    parser.add_argument('--answers', type=int, default=1000000, help="целевое число ответов")
+    parser.add_argument('--applications', type=int, help="число откликов (по умолчанию из --answers)")
+    parser.add_argument('--min-questions', type=int, default=3)
+    parser.add_argument('--max-questions', type=int, default=8)
+    parser.add_argument('--campaigns-per-business', type=int, default=3)
+    parser.add_argument('--skew', type=float, default=1.0, help="показатель Zipf (0 - равномерно)")
+    parser.add_argument('--days', type=int, default=90, help="глубина истории в днях")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--batch-rows', type=int, default=50000, help="строк в одном COPY")
+    parser.add_argument('--chunk-answers', type=int, default=500000, help="ответов на одну задачу воркера")
+    parser.add_argument('--truncate', action='store_true', help="очистить таблицы Jobzi перед загрузкой")
+    opts = parser.parse_args(argv)
+
+    if opts.users < 1 or opts.businesses < 1:
+        parser.error("--users и --businesses должны быть положительными")
+    if not 1 <= opts.min_questions <= opts.max_questions:
+        parser.error("неверный диапазон --min-questions/--max-questions")
+    if opts.max_questions > sum(len(texts) for texts in QUESTION_TEXTS.values()):
+        parser.error("--max-questions больше числа различных текстов вопросов")
+    opts.until = time.time()
+    return opts
+
+
+def main(argv=None):
+    opts = parse_args(argv)
+    started = time.time()
+
+    vacancies, chunks, planned = build_plan(opts)
+    print("План: " + ', '.join('%s=%d' % (table, planned[table]) for table in LOAD_ORDER))
+
+    if opts.out:
+        os.makedirs(opts.out, exist_ok=True)
+    else:
+        prepare_database(opts)
+
+    loaded = load_serial(opts, [
+        ('businesses', generate_businesses(opts)),
+        ('users', generate_users(opts)),
+        ('business_users', generate_business_users(opts)),
+    ])
+
+    with multiprocessing.Pool(opts.workers) as pool:
+        # Фазы разделены барьером: отклики ссылаются на вакансии из любых чанков
+        for phase in ('vacancies', 'applications'):
+            phase_started = time.time()
+            counts = load_parallel(opts, vacancies, chunks, phase, pool)
+            loaded.update(counts)
+            print("Фаза %s: %s за %.1f с" % (phase, ', '.join('%s=%d' % item for item in sorted(counts.items())),
+                                             time.time() - phase_started))
+
+    loaded.update(load_serial(opts, [('broadcast_campaigns', generate_campaigns(opts))]))
+
+    if not opts.out:
+        finish_database(opts)
+
+    total_rows = sum(loaded.values())
+    elapsed = time.time() - started
+    print("Загружено строк: %d за %.1f с (%.0f строк/с)" % (total_rows, elapsed, total_rows / max(elapsed, 1e-9)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
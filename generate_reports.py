@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Еженедельные отчеты для бизнесов: вакансии, воронка откликов, статусы.
+#
+# Отчет строится за отчетную ISO-неделю (--week, по умолчанию последняя
+# завершенная неделя) и учитывает вакансии и отклики, созданные не позже ее
+# конца (даты в UTC).
+#
+# Для каждого бизнеса считается watermark - максимальный updated_at по самому
+# бизнесу, его вакансиям и откликам, плюс число вакансий и откликов (чтобы
+# заметить удаления). Отчет перестраивается только если с прошлого запуска
+# изменился watermark или отчетная неделя; если данные отчета при этом совпадают
+# с прошлыми (тот же хэш содержимого), презентация не перерисовывается.
+#
+# Презентации рендерятся в пуле процессов теми же функциями, что и
+# create_presentation(), и сохраняются в подкаталог недели (reports/2026-W41/)
+# рядом с его manifest.json, где для каждого бизнеса записаны watermark, хэш
+# содержимого и файл отчета. Поэтому пересборка прошлой недели не затирает
+# текущие отчеты и не вынуждает перерисовывать их при следующем запуске.
+#
+# Источник данных - БД Jobzi (нужен psycopg2) или каталог файлов COPY,
+# созданный generate_dataset.py --out.
+#
+# Использование:
+#   python3 generate_reports.py                          # БД по умолчанию, каталог reports/<неделя>/
+#   python3 generate_reports.py --fixture /tmp/jobzi_data --out-dir /tmp/reports
+#   python3 generate_reports.py --week 2026-W41          # отчет за конкретную неделю
+#   python3 generate_reports.py --force                  # перестроить все отчеты
+
+import argparse
+import datetime
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+DEFAULT_DSN = 'host=localhost port=5432 dbname=jobzi user=jobzi password=jobzi'
+MANIFEST_FILE = 'manifest.json'
+REPORT_VERSION = 3
+
+APPLICATION_STATUSES = ['NEW', 'VIEWED', 'CONTACTED', 'ACCEPTED', 'REJECTED']
+VACANCY_STATUSES = ['ACTIVE', 'PAUSED', 'CLOSED', 'DRAFT']
+
+STATUS_LABELS = {
+    'NEW': 'Новые',
+    'VIEWED': 'Просмотренные',
+    'CONTACTED': 'Связались',
+    'ACCEPTED': 'Приняты',
+    'REJECTED': 'Отклонены',
+    'ACTIVE': 'Активные',
+    'PAUSED': 'Приостановлены',
+    'CLOSED': 'Закрыты',
+    'DRAFT': 'Черновики',
+}
+
+TOP_VACANCIES = 10
+
+
+# ---------- Источники данных ----------
+
+class DatabaseSource:
+
+    WATERMARKS_SQL = """
+        SELECT b.id, b.name,
+               GREATEST(b.updated_at, COALESCE(v.watermark, b.updated_at), COALESCE(a.watermark, b.updated_at)),
+               COALESCE(v.total, 0), COALESCE(a.total, 0)
+        FROM businesses b
+        LEFT JOIN (SELECT business_id, MAX(updated_at) AS watermark, COUNT(*) AS total
+                   FROM vacancies GROUP BY business_id) v ON v.business_id = b.id
+        LEFT JOIN (SELECT v.business_id, MAX(a.updated_at) AS watermark, COUNT(*) AS total
+                   FROM applications a JOIN vacancies v ON v.id = a.vacancy_id
+                   GROUP BY v.business_id) a ON a.business_id = b.id
+        WHERE b.is_active
+    """
+
+    REPORT_ROWS_SQL = """
+        SELECT v.business_id, v.id, v.code, v.title, v.status, (v.created_at AT TIME ZONE 'UTC')::date,
+               a.status, (a.created_at AT TIME ZONE 'UTC')::date, COUNT(a.id)
+        FROM vacancies v
+        LEFT JOIN applications a ON a.vacancy_id = v.id
+        WHERE v.business_id = ANY(%s)
+        GROUP BY v.business_id, v.id, v.code, v.title, v.status, (v.created_at AT TIME ZONE 'UTC')::date,
+                 a.status, (a.created_at AT TIME ZONE 'UTC')::date
+    """
+
+    def __init__(self, dsn):
+        try:
+            import psycopg2
+        except ImportError:
+            sys.exit("Для чтения из БД нужен psycopg2: pip install psycopg2-binary (или используйте --fixture)")
+        self.connection = psycopg2.connect(dsn)
+
+    def watermarks(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(self.WATERMARKS_SQL)
+            return {row[0]: {'name': row[1], 'watermark': row[2].isoformat(),
+                             'vacancies': row[3], 'applications': row[4]}
+                    for row in cursor}
+
+    def report_rows(self, business_ids):
+        # Серверный курсор - строки приходят порциями, а не одним списком
+        with self.connection.cursor(name='report_rows') as cursor:
+            cursor.itersize = 10000
+            cursor.execute(self.REPORT_ROWS_SQL, (list(business_ids),))
+            for business_id, vacancy_id, code, title, status, vacancy_date, app_status, app_date, count in cursor:
+                yield (business_id, vacancy_id, code, title, status, vacancy_date.isoformat(), app_status,
+                       app_date.isoformat() if app_date else None, count)
+
+    def close(self):
+        self.connection.close()
+
+
+class FixtureSource:
+    """Каталог файлов COPY от generate_dataset.py --out (businesses*.tsv, vacancies*.tsv, applications*.tsv)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.businesses = {}
+        self.vacancies = {}
+        self.counts = {}
+        self._scan()
+
+    def _rows(self, table):
+        for name in sorted(glob.glob(os.path.join(self.path, '%s*.tsv' % table))):
+            with open(name, encoding='utf-8') as f:
+                for line in f:
+                    yield [unescape_copy(value) for value in line.rstrip('\n').split('\t')]
+
+    def _scan(self):
+        # Один проход по откликам: агрегаты (вакансия, статус, день) и watermark бизнеса
+        for row in self._rows('businesses'):
+            if row[4] == 't':
+                self.businesses[int(row[0])] = {'name': row[1], 'watermark': row[6],
+                                                'vacancies': 0, 'applications': 0}
+
+        for row in self._rows('vacancies'):
+            business = self.businesses.get(int(row[1]))
+            if business is None:
+                continue
+            self.vacancies[int(row[0])] = (int(row[1]), row[2], row[3], row[7], row[8][:10])
+            business['vacancies'] += 1
+            business['watermark'] = max(business['watermark'], row[9])
+
+        for row in self._rows('applications'):
+            vacancy = self.vacancies.get(int(row[1]))
+            if vacancy is None:
+                continue
+            business = self.businesses[vacancy[0]]
+            business['applications'] += 1
+            business['watermark'] = max(business['watermark'], row[6])
+            key = (int(row[1]), row[3], row[5][:10])
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def watermarks(self):
+        return self.businesses
+
+    def report_rows(self, business_ids):
+        business_ids = set(business_ids)
+        with_applications = set()
+        for (vacancy_id, app_status, app_date), count in self.counts.items():
+            business_id, code, title, status, vacancy_date = self.vacancies[vacancy_id]
+            if business_id in business_ids:
+                with_applications.add(vacancy_id)
+                yield business_id, vacancy_id, code, title, status, vacancy_date, app_status, app_date, count
+
+        for vacancy_id, (business_id, code, title, status, vacancy_date) in self.vacancies.items():
+            if business_id in business_ids and vacancy_id not in with_applications:
+                yield business_id, vacancy_id, code, title, status, vacancy_date, None, None, 0
+
+    def close(self):
+        pass
+
+
+def unescape_copy(value):
+    if value == '\\N':
+        return None
+    if '\\' not in value:
+        return value
+    return value.replace('\\t', '\t').replace('\\n', '\n').replace('\\r', '\r').replace('\\\\', '\\')
+
+
+# ---------- Данные отчета ----------
+
+def reporting_week(value=None, today=None):
+    # Отчетная неделя: явно заданная ISO-неделя или последняя завершенная
+    if value:
+        match = re.match(r'^(\d{4})-W(\d{2})$', value)
+        if not match:
+            raise ValueError("Неделя должна быть в формате ГГГГ-Wнн, например 2026-W41")
+        week_start = datetime.date.fromisocalendar(int(match.group(1)), int(match.group(2)), 1)
+    else:
+        today = today or datetime.datetime.now(datetime.timezone.utc).date()
+        week_start = today - datetime.timedelta(days=today.weekday() + 7)
+    year, week, _ = week_start.isocalendar()
+    return '%d-W%02d' % (year, week), week_start, week_start + datetime.timedelta(days=6)
+
+
+def build_reports(businesses, rows, week):
+    # Отчет - чистая функция от данных и отчетной недели. Watermark в него не
+    # входит (он нужен только для поиска изменений), иначе хэш содержимого
+    # менялся бы при любом касании updated_at
+    week_label, week_start, week_end = week
+    week_start, week_end = week_start.isoformat(), week_end.isoformat()
+    reports = {}
+    for business_id, business in businesses.items():
+        reports[business_id] = {
+            'version': REPORT_VERSION,
+            'business': {'id': business_id, 'name': business['name']},
+            'week': week_label,
+            'week_start': week_start,
+            'week_end': week_end,
+            'vacancies': {},
+            'statuses': dict.fromkeys(APPLICATION_STATUSES, 0),
+            'week_applications': 0,
+        }
+
+    for business_id, vacancy_id, code, title, status, vacancy_date, app_status, app_date, count in rows:
+        # Вакансии и отклики после конца отчетной недели попадут в отчет следующей недели
+        if vacancy_date > week_end:
+            continue
+        report = reports[business_id]
+        vacancy = report['vacancies'].get(vacancy_id)
+        if vacancy is None:
+            vacancy = report['vacancies'][vacancy_id] = {
+                'code': code, 'title': title, 'status': status, 'applications': 0, 'week_applications': 0,
+            }
+        if not app_status or app_date > week_end:
+            continue
+        vacancy['applications'] += count
+        report['statuses'][app_status] = report['statuses'].get(app_status, 0) + count
+        if app_date >= week_start:
+            vacancy['week_applications'] += count
+            report['week_applications'] += count
+
+    for report in reports.values():
+        vacancies = sorted(report['vacancies'].values(), key=lambda v: (-v['applications'], v['code']))
+        report['vacancies'] = vacancies
+        report['vacancy_statuses'] = {status: sum(1 for v in vacancies if v['status'] == status)
+                                      for status in VACANCY_STATUSES}
+    return reports
+
+
+def content_hash(report):
+    payload = json.dumps(report, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def fingerprint(business, week_label):
+    return '%s|%s|%d|%d' % (week_label, business['watermark'], business['vacancies'], business['applications'])
+
+
+# ---------- Рендеринг ----------
+
+def render_deck(report, path):
+    from create_presentation import new_presentation, add_title_slide, add_bullet_slide, add_paragraph
+
+    prs = new_presentation()
+    statuses = report['statuses']
+    total = sum(statuses.values())
+
+    add_title_slide(prs, "Еженедельный отчет: %s" % report['business']['name'],
+                    "Неделя %s (%s - %s)\nДанные на конец недели" % (report['week'], report['week_start'],
+                                                                    report['week_end']))
+
+    # Слайд: Вакансии
+    tf = add_bullet_slide(prs, "Вакансии")
+    add_paragraph(tf, "Всего вакансий: %d" % len(report['vacancies']), size=20, bold=True)
+    for status, count in report['vacancy_statuses'].items():
+        add_paragraph(tf, "%s: %d" % (STATUS_LABELS[status], count), level=1)
+    add_paragraph(tf, "Откликов за неделю: %d" % report['week_applications'], size=20, bold=True)
+    add_paragraph(tf, "Откликов всего на конец недели: %d" % total, level=1)
+
+    # Слайд: Воронка откликов
+    tf = add_bullet_slide(prs, "Воронка откликов")
+    funnel = [
+        ("Получено", total),
+        ("Просмотрено", total - statuses['NEW']),
+        ("Связались", statuses['CONTACTED'] + statuses['ACCEPTED']),
+        ("Приняты", statuses['ACCEPTED']),
+    ]
+    for label, count in funnel:
+        share = " (%.0f%%)" % (100.0 * count / total) if total else ""
+        add_paragraph(tf, "%s: %d%s" % (label, count, share), size=20)
+
+    # Слайд: Статусы откликов
+    tf = add_bullet_slide(prs, "Статусы откликов")
+    for status in APPLICATION_STATUSES:
+        add_paragraph(tf, "%s: %d" % (STATUS_LABELS[status], statuses[status]), size=20)
+
+    # Слайд: Самые популярные вакансии
+    tf = add_bullet_slide(prs, "Вакансии по числу откликов")
+    for vacancy in report['vacancies'][:TOP_VACANCIES]:
+        add_paragraph(tf, "%s - %s: %d (за неделю %d)" % (vacancy['code'], vacancy['title'], vacancy['applications'],
+                                                       vacancy['week_applications']), size=14)
+    if not report['vacancies']:
+        add_paragraph(tf, "Вакансий пока нет", size=16, color=(128, 128, 128))
+
+    tmp_path = path + '.tmp'
+    prs.save(tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+# ---------- Планирование запуска ----------
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, MANIFEST_FILE), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'businesses': {}}
+
+
+def save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST_FILE)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(path + '.tmp', path)
+
+
+def deck_name(business_id):
+    return 'business_%d.pptx' % business_id
+
+
+def run(source, opts):
+    week = reporting_week(opts.week)
+    # У каждой недели свой каталог и манифест
+    out_dir = os.path.join(opts.out_dir, week[0])
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    entries = manifest['businesses']
+    businesses = source.watermarks()
+
+    # Бизнесы, которых больше нет (или они неактивны) - удаляем их отчеты
+    removed = [key for key in entries if int(key) not in businesses]
+    for key in removed:
+        deck_path = os.path.join(out_dir, entries.pop(key)['file'])
+        if os.path.exists(deck_path):
+            os.remove(deck_path)
+
+    changed = {}
+    for business_id, business in businesses.items():
+        entry = entries.get(str(business_id))
+        up_to_date = (entry is not None and entry['fingerprint'] == fingerprint(business, week[0])
+                      and os.path.exists(os.path.join(out_dir, entry['file'])))
+        if opts.force or not up_to_date:
+            changed[business_id] = business
+
+    reports = build_reports(changed, source.report_rows(changed), week) if changed else {}
+
+    to_render = {}
+    for business_id, report in reports.items():
+        entry = entries.get(str(business_id))
+        digest = content_hash(report)
+        if not opts.force and entry is not None and entry['content_hash'] == digest \
+                and os.path.exists(os.path.join(out_dir, entry['file'])):
+            entry['fingerprint'] = fingerprint(changed[business_id], week[0])
+            entry['watermark'] = changed[business_id]['watermark']
+            entry['week'] = week[0]
+            continue
+        to_render[business_id] = (report, digest)
+
+    rendered = failed = 0
+    with ProcessPoolExecutor(max_workers=opts.workers) as pool:
+        futures = {pool.submit(render_deck, report, os.path.join(out_dir, deck_name(business_id))): business_id
+                   for business_id, (report, _) in to_render.items()}
+        for future in as_completed(futures):
+            business_id = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                # Запись в манифесте не обновляется - отчет перестроится при следующем запуске
+                print("Ошибка рендеринга отчета бизнеса %d: %s" % (business_id, e), file=sys.stderr)
+                failed += 1
+                continue
+            entries[str(business_id)] = {
+                'file': deck_name(business_id),
+                'watermark': changed[business_id]['watermark'],
+                'week': week[0],
+                'fingerprint': fingerprint(changed[business_id], week[0]),
+                'content_hash': to_render[business_id][1],
+                'rendered_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            }
+            rendered += 1
+
+    save_manifest(out_dir, manifest)
+    return {
+        'out_dir': out_dir,
+        'businesses': len(businesses),
+        'changed': len(changed),
+        'rendered': rendered,
+        'unchanged_content': len(reports) - len(to_render),
+        'failed': failed,
+        'removed': len(removed),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Инкрементальная генерация еженедельных отчетов по бизнесам")
+    parser.add_argument('--dsn', default=os.environ.get('JOBZI_DSN', DEFAULT_DSN), help="строка подключения libpq")
+    parser.add_argument('--fixture', help="каталог файлов COPY от generate_dataset.py --out вместо БД")
+    parser.add_argument('--out-dir', default='reports', help="каталог отчетов и манифеста")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="процессов для рендеринга")
+    parser.add_argument('--week', help="отчетная ISO-неделя ГГГГ-Wнн (по умолчанию последняя завершенная)")
+    parser.add_argument('--force', action='store_true', help="перестроить все отчеты независимо от манифеста")
+    opts = parser.parse_args(argv)
+    try:
+        reporting_week(opts.week)
+    except ValueError as e:
+        parser.error(str(e))
+
+    started = time.time()
+    source = FixtureSource(opts.fixture) if opts.fixture else DatabaseSource(opts.dsn)
+    try:
+        stats = run(source, opts)
+    finally:
+        source.close()
+
+    print("Бизнесов: %(businesses)d, изменились: %(changed)d, отрисовано: %(rendered)d, "
+          "без изменений в отчете: %(unchanged_content)d, удалено: %(removed)d, ошибок: %(failed)d" % stats)
+    print("Готово за %.1f с, отчеты в %s" % (time.time() - started, stats['out_dir']))
+    return 1 if stats['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())